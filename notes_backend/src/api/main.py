@@ -1,23 +1,37 @@
-from datetime import datetime
-from typing import Dict, List, Optional
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Annotated, Dict, List, Optional
 from uuid import UUID, uuid4
 
+import orjson
 from fastapi import FastAPI, HTTPException, Path, status
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, field_validator
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, Field, StringConstraints
+from starlette.requests import Request
+from starlette.routing import Route
+
+from src.api.middleware import BodySizeLimitMiddleware, FastCORSMiddleware
+
+# Titles are stripped and must be non-empty; checked by pydantic-core rather than a Python validator
+MAX_TITLE_LENGTH = 1024
+Title = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=MAX_TITLE_LENGTH)]
+# Content is capped in characters; the request body limit below is derived from both caps
+MAX_CONTENT_LENGTH = 16 * 1024
+Content = Annotated[str, StringConstraints(max_length=MAX_CONTENT_LENGTH)]
+# Body limit in bytes for BodySizeLimitMiddleware. A JSON-escaped astral character (e.g. an emoji as
+# "\ud83d\ude00") takes 12 bytes, so a max-length title and content can need 12 bytes per character.
+# The extra 64 KiB covers JSON keys and formatting; titles are capped after whitespace stripping, so
+# bodies padding the title beyond that headroom may still be rejected.
+MAX_BODY_BYTES = 12 * (MAX_TITLE_LENGTH + MAX_CONTENT_LENGTH) + 64 * 1024
+
 
 # PUBLIC_INTERFACE
 class NoteBase(BaseModel):
     """Base fields for creating or updating a note."""
-    title: str = Field(..., description="Title of the note")
-    content: Optional[str] = Field(None, description="Content of the note (optional)")
-
-    @field_validator("title")
-    @classmethod
-    def validate_title_non_empty(cls, v: str) -> str:
-        if not isinstance(v, str) or not v.strip():
-            raise ValueError("title must be a non-empty string")
-        return v.strip()
+    title: Title = Field(..., description="Title of the note")
+    content: Optional[Content] = Field(None, description="Content of the note (optional)")
 
 
 # PUBLIC_INTERFACE
@@ -29,17 +43,8 @@ class NoteCreate(NoteBase):
 # PUBLIC_INTERFACE
 class NoteUpdate(BaseModel):
     """Schema for updating an existing note."""
-    title: Optional[str] = Field(None, description="Updated title of the note")
-    content: Optional[str] = Field(None, description="Updated content of the note (optional)")
-
-    @field_validator("title")
-    @classmethod
-    def validate_title_if_present(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        if not isinstance(v, str) or not v.strip():
-            raise ValueError("title must be a non-empty string when provided")
-        return v.strip()
+    title: Optional[Title] = Field(None, description="Updated title of the note")
+    content: Optional[Content] = Field(None, description="Updated content of the note (optional)")
 
 
 # PUBLIC_INTERFACE
@@ -50,101 +55,190 @@ class Note(NoteBase):
     updated_at: datetime = Field(..., description="Last update timestamp in UTC")
 
 
+@dataclass(slots=True)
+class NoteRow:
+    """Stored representation of a note; fields and order match the Note schema, values are JSON-ready."""
+    title: str
+    content: Optional[str]
+    id: str
+    created_at: str
+    updated_at: str
+
+
+# Note IDs are UUIDs, accepted in canonical hyphenated or 32-digit hex form. The length bounds
+# are checked before the pattern, so malformed IDs are usually rejected without running the regex.
+NOTE_ID_MIN_LENGTH = 32
+NOTE_ID_MAX_LENGTH = 36
+NOTE_ID_PATTERN = (
+    r"^(?:[0-9a-fA-F]{32}|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+# Sentinel for single-lookup dict pops where any stored value is valid
+_MISSING = object()
+
+# The slot index is split into shards selected by the top byte of the 128-bit key
+_SHARD_COUNT = 256
+_SHARD_SHIFT = 120
+
+
+def _note_key(note_id: str) -> int:
+    """Convert a note ID to the 128-bit integer form of its UUID used as the store key."""
+    return int(note_id.replace("-", ""), 16)
+
+
+# Current UTC time in ISO format, reused by writes landing in the same millisecond so they share
+# one datetime construction. Refreshed lazily on the request path; nothing runs in the background.
+_NOW_ISO = ""
+_NOW_ISO_MS = -1
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC timestamp, cached for the current millisecond of the monotonic clock."""
+    global _NOW_ISO, _NOW_ISO_MS
+    ms = time.monotonic_ns() // 1_000_000
+    if ms != _NOW_ISO_MS:
+        _NOW_ISO = datetime.now(timezone.utc).isoformat()
+        _NOW_ISO_MS = ms
+    return _NOW_ISO
+
+
 # Service abstraction with in-memory persistence for now.
 class NotesService:
     """Service layer for managing notes. Uses an in-memory store; can be swapped out with a DB implementation later."""
     def __init__(self) -> None:
-        # Using a dict[UUID, Note] as the in-memory store
-        self._store: Dict[UUID, Note] = {}
+        # Notes are kept densely in insertion slots: _items holds slotted NoteRow records (no per-note
+        # __dict__) and _keys the UUID integer key of each slot. The key-to-slot index is split into
+        # shard dicts selected by the key's top byte.
+        # Listing walks the flat list instead of a sparse hash table.
+        self._items: List[NoteRow] = []
+        self._keys: List[int] = []
+        self._pos_shards: List[Dict[int, int]] = [{} for _ in range(_SHARD_COUNT)]
+        # Serialized JSON of the full list; reset to None whenever the store changes
+        self._list_cache: Optional[bytes] = None
 
     # PUBLIC_INTERFACE
-    def create(self, payload: NoteCreate) -> Note:
+    def create(self, payload: NoteCreate) -> NoteRow:
         """Create a new note from the provided payload."""
-        now = datetime.utcnow()
-        note = Note(id=uuid4(), title=payload.title, content=payload.content, created_at=now, updated_at=now)
-        self._store[note.id] = note
+        note_id = uuid4()
+        now = _utc_now_iso()
+        note = NoteRow(title=payload.title, content=payload.content, id=str(note_id), created_at=now, updated_at=now)
+        key = note_id.int
+        self._pos_shards[key >> _SHARD_SHIFT][key] = len(self._items)
+        self._items.append(note)
+        self._keys.append(key)
+        self._list_cache = None
         return note
 
     # PUBLIC_INTERFACE
-    def list(self) -> List[Note]:
+    def list(self) -> List[NoteRow]:
         """List all notes."""
-        return list(self._store.values())
+        return list(self._items)
 
     # PUBLIC_INTERFACE
-    def get(self, note_id: UUID) -> Note:
+    def list_bytes(self) -> bytes:
+        """List all notes as a serialized JSON array, reusing the cached encoding until the store changes.
+
+        orjson serializes the NoteRow dataclasses natively, in field order.
+        """
+        if self._list_cache is None:
+            self._list_cache = orjson.dumps(self._items)
+        return self._list_cache
+
+    # PUBLIC_INTERFACE
+    def get(self, note_id: str) -> NoteRow:
         """Retrieve a single note by ID."""
-        note = self._store.get(note_id)
-        if not note:
+        key = _note_key(note_id)
+        pos = self._pos_shards[key >> _SHARD_SHIFT].get(key)
+        if pos is None:
             raise KeyError("not_found")
-        return note
+        return self._items[pos]
 
     # PUBLIC_INTERFACE
-    def update(self, note_id: UUID, payload: NoteUpdate) -> Note:
-        """Update an existing note by ID with provided fields."""
-        note = self._store.get(note_id)
-        if not note:
+    def update(self, note_id: str, payload: NoteUpdate) -> NoteRow:
+        """Update an existing note by ID with provided fields, in place."""
+        key = _note_key(note_id)
+        pos = self._pos_shards[key >> _SHARD_SHIFT].get(key)
+        if pos is None:
             raise KeyError("not_found")
 
-        data = note.model_dump()
+        note = self._items[pos]
         if payload.title is not None:
-            data["title"] = payload.title
+            note.title = payload.title
         if payload.content is not None:
-            data["content"] = payload.content
-        data["updated_at"] = datetime.utcnow()
-        updated = Note(**data)
-        self._store[note_id] = updated
-        return updated
+            note.content = payload.content
+        note.updated_at = _utc_now_iso()
+        self._list_cache = None
+        return note
 
     # PUBLIC_INTERFACE
-    def delete(self, note_id: UUID) -> None:
-        """Delete a note by ID."""
-        if note_id not in self._store:
+    def delete(self, note_id: str) -> None:
+        """Delete a note by ID. The last note is moved into the freed slot, so list order is not preserved."""
+        key = _note_key(note_id)
+        pos = self._pos_shards[key >> _SHARD_SHIFT].pop(key, _MISSING)
+        if pos is _MISSING:
             raise KeyError("not_found")
-        del self._store[note_id]
+
+        last_note = self._items.pop()
+        last_key = self._keys.pop()
+        if pos < len(self._items):
+            self._items[pos] = last_note
+            self._keys[pos] = last_key
+            self._pos_shards[last_key >> _SHARD_SHIFT][last_key] = pos
+        self._list_cache = None
 
 
+# Set PROD to disable the OpenAPI schema and interactive docs endpoints in production
+IS_PRODUCTION = bool(os.getenv("PROD"))
+
 # Initialize FastAPI app with metadata and CORS
 app = FastAPI(
     title="Notes Management API",
     description="A simple FastAPI service providing CRUD operations for notes.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    openapi_url=None if IS_PRODUCTION else "/openapi.json",
+    docs_url=None if IS_PRODUCTION else "/docs",
+    redoc_url=None if IS_PRODUCTION else "/redoc",
     openapi_tags=[
         {"name": "Health", "description": "Service health endpoints"},
         {"name": "Notes", "description": "CRUD operations for notes"},
     ],
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict to known front-end origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Reject oversized request bodies before they are read or parsed
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=MAX_BODY_BYTES)
+# Allows any origin; in production, restrict to known front-end origins. Added last so it is the
+# outermost middleware and also decorates early rejections.
+app.add_middleware(FastCORSMiddleware)
 
 # Create a singleton service instance for the app lifetime
 notes_service = NotesService()
 
+# The health payload never changes, so it is encoded once; a fresh Response is still built per
+# call so no response object (or its header list) is shared between requests.
+_HEALTH_BYTES = b'{"status":"ok"}'
+
 
 @app.get(
     "/health",
     summary="Health Check",
     description="Returns basic health status for the service.",
     tags=["Health"],
-    response_model=dict,
     responses={
         200: {"description": "Service is healthy", "content": {"application/json": {"example": {"status": "ok"}}}}
     },
 )
+# Kept only for the OpenAPI schema; requests are served by _health_route registered below.
 # PUBLIC_INTERFACE
-def health_check() -> dict:
+async def health_check() -> Response:
     """Health check endpoint.
     Returns a simple JSON indicating that the service is operational.
 
     Returns:
-        dict: An object with status set to 'ok'
+        Response: A JSON body with status set to 'ok'
     """
-    return {"status": "ok"}
+    return Response(_HEALTH_BYTES, media_type="application/json")
 
 
 @app.post(
@@ -152,18 +246,19 @@ def health_check() -> dict:
     summary="Create Note",
     description="Create a new note with a non-empty title and optional content.",
     tags=["Notes"],
-    response_model=Note,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": Note, "description": "Note created"}},
 )
 # PUBLIC_INTERFACE
-def create_note(payload: NoteCreate) -> Note:
+async def create_note(payload: NoteCreate) -> ORJSONResponse:
     """Create a new note.
     Parameters:
         payload (NoteCreate): The note creation payload containing a non-empty title and optional content.
     Returns:
         Note: The created note including id and timestamps.
     """
-    return notes_service.create(payload)
+    return ORJSONResponse(notes_service.create(payload), status_code=status.HTTP_201_CREATED)
 
 
 @app.get(
@@ -171,15 +266,16 @@ def create_note(payload: NoteCreate) -> Note:
     summary="List Notes",
     description="List all notes currently stored by the service.",
     tags=["Notes"],
-    response_model=List[Note],
+    responses={200: {"model": List[Note], "description": "All stored notes"}},
 )
+# Kept only for the OpenAPI schema; requests are served by _list_notes_route registered below.
 # PUBLIC_INTERFACE
-def list_notes() -> List[Note]:
+async def list_notes() -> Response:
     """List all notes.
     Returns:
-        List[Note]: A list of notes.
+        Response: A JSON array of notes (List[Note]), sent as the service's cached JSON encoding.
     """
-    return notes_service.list()
+    return Response(notes_service.list_bytes(), media_type="application/json")
 
 
 @app.get(
@@ -187,23 +283,29 @@ def list_notes() -> List[Note]:
     summary="Get Note",
     description="Retrieve a single note by its ID.",
     tags=["Notes"],
-    response_model=Note,
-    responses={404: {"description": "Note not found"}},
+    response_class=ORJSONResponse,
+    responses={200: {"model": Note, "description": "The requested note"}, 404: {"description": "Note not found"}},
 )
 # PUBLIC_INTERFACE
-def get_note(
-    note_id: UUID = Path(..., description="The UUID of the note to retrieve"),
-) -> Note:
+async def get_note(
+    note_id: str = Path(
+        ...,
+        description="The UUID of the note to retrieve",
+        min_length=NOTE_ID_MIN_LENGTH,
+        max_length=NOTE_ID_MAX_LENGTH,
+        pattern=NOTE_ID_PATTERN,
+    ),
+) -> ORJSONResponse:
     """Retrieve a note by ID.
     Parameters:
-        note_id (UUID): The UUID of the desired note.
+        note_id (str): The UUID of the desired note.
     Returns:
         Note: The requested note.
     Raises:
         HTTPException(404): If the note does not exist.
     """
     try:
-        return notes_service.get(note_id)
+        return ORJSONResponse(notes_service.get(note_id))
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
 
@@ -213,17 +315,23 @@ def get_note(
     summary="Update Note",
     description="Update fields of an existing note. Title, if provided, must be non-empty.",
     tags=["Notes"],
-    response_model=Note,
-    responses={404: {"description": "Note not found"}},
+    response_class=ORJSONResponse,
+    responses={200: {"model": Note, "description": "The updated note"}, 404: {"description": "Note not found"}},
 )
 # PUBLIC_INTERFACE
-def update_note(
-    note_id: UUID = Path(..., description="The UUID of the note to update"),
+async def update_note(
+    note_id: str = Path(
+        ...,
+        description="The UUID of the note to update",
+        min_length=NOTE_ID_MIN_LENGTH,
+        max_length=NOTE_ID_MAX_LENGTH,
+        pattern=NOTE_ID_PATTERN,
+    ),
     payload: NoteUpdate = ...,
-) -> Note:
+) -> ORJSONResponse:
     """Update an existing note.
     Parameters:
-        note_id (UUID): The UUID of the note to update.
+        note_id (str): The UUID of the note to update.
         payload (NoteUpdate): Fields to update (title and/or content).
     Returns:
         Note: The updated note.
@@ -231,7 +339,7 @@ def update_note(
         HTTPException(404): If the note does not exist.
     """
     try:
-        return notes_service.update(note_id, payload)
+        return ORJSONResponse(notes_service.update(note_id, payload))
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
 
@@ -241,14 +349,23 @@ def update_note(
     summary="Delete Note",
     description="Delete a note by its ID.",
     tags=["Notes"],
+    response_class=ORJSONResponse,
     status_code=status.HTTP_204_NO_CONTENT,
     responses={404: {"description": "Note not found"}, 204: {"description": "Deleted"}},
 )
 # PUBLIC_INTERFACE
-def delete_note(note_id: UUID = Path(..., description="The UUID of the note to delete")) -> None:
+async def delete_note(
+    note_id: str = Path(
+        ...,
+        description="The UUID of the note to delete",
+        min_length=NOTE_ID_MIN_LENGTH,
+        max_length=NOTE_ID_MAX_LENGTH,
+        pattern=NOTE_ID_PATTERN,
+    ),
+) -> None:
     """Delete a note by ID.
     Parameters:
-        note_id (UUID): The UUID of the note to delete.
+        note_id (str): The UUID of the note to delete.
     Raises:
         HTTPException(404): If the note does not exist.
     """
@@ -256,3 +373,36 @@ def delete_note(note_id: UUID = Path(..., description="The UUID of the note to d
         notes_service.delete(note_id)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
+
+
+async def _health_route(request: Request) -> Response:
+    return Response(_HEALTH_BYTES, media_type="application/json")
+
+
+async def _list_notes_route(request: Request) -> Response:
+    return Response(notes_service.list_bytes(), media_type="application/json")
+
+
+# Serve the hot read-only endpoints as plain Starlette routes placed ahead of the FastAPI ones,
+# skipping dependency resolution and response serialization. The decorated handlers above stay
+# registered so these endpoints are still described in the OpenAPI schema.
+app.router.routes[0:0] = [
+    Route("/health", _health_route, methods=["GET"]),
+    Route("/notes", _list_notes_route, methods=["GET"]),
+]
+
+
+if __name__ == "__main__":
+    # Entry point: `python -m src.api.main` from the notes_backend directory. Runs a single worker,
+    # since the in-memory store is per process, on uvloop with the httptools parser and no access log.
+    import uvicorn
+
+    uvicorn.run(
+        app,
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning",
+    )
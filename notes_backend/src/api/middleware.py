@@ -0,0 +1,105 @@
+from typing import List, Tuple
+
+from starlette.status import HTTP_413_REQUEST_ENTITY_TOO_LARGE
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_PREFLIGHT_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+]
+_TOO_LARGE_BODY = b'{"detail":"Request body too large"}'
+_TOO_LARGE_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_TOO_LARGE_BODY)).encode()),
+]
+
+
+# PUBLIC_INTERFACE
+class FastCORSMiddleware:
+    """Pure-ASGI CORS middleware allowing any origin, with credentials.
+
+    Echoes the request Origin with allow-credentials and Vary: Origin on every
+    cross-origin response and answers preflight requests directly, without
+    building Starlette Request/Response objects. Requests without an Origin
+    header pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        requested_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                requested_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + _PREFLIGHT_HEADERS + [(b"vary", b"Origin")]
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Build a new list; the response may reuse its own header list across sends.
+                headers = []
+                vary = b"Origin"
+                for key, value in message.get("headers", ()):
+                    if key.lower() == b"vary":
+                        vary = value + b", Origin"
+                    else:
+                        headers.append((key, value))
+                message["headers"] = headers + cors_headers + [(b"vary", vary)]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# PUBLIC_INTERFACE
+class BodySizeLimitMiddleware:
+    """Pure-ASGI middleware rejecting requests whose declared Content-Length exceeds a limit.
+
+    Oversized requests get a 413 before their body is read or parsed.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for key, value in scope["headers"]:
+                if key == b"content-length":
+                    if value.isdigit() and int(value) > self.max_bytes:
+                        await send(
+                            {
+                                "type": "http.response.start",
+                                "status": HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                                "headers": list(_TOO_LARGE_HEADERS),
+                            }
+                        )
+                        await send({"type": "http.response.body", "body": _TOO_LARGE_BODY})
+                        return
+                    break
+        await self.app(scope, receive, send)
@@ -0,0 +1,45 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from src.api.main import MAX_BODY_BYTES, MAX_CONTENT_LENGTH, MAX_TITLE_LENGTH, app
+
+client = TestClient(app)
+
+
+def _post_note(content: str, title: str = "t"):
+    # Stdlib json.dumps escapes non-ASCII by default, the worst case for body size
+    body = json.dumps({"title": title, "content": content})
+    return client.post("/notes", content=body, headers={"content-type": "application/json"})
+
+
+def test_max_length_escaped_content_is_accepted():
+    for char in ("é", "中", "😀"):
+        response = _post_note(char * MAX_CONTENT_LENGTH)
+        assert response.status_code == 201
+        assert response.json()["content"] == char * MAX_CONTENT_LENGTH
+
+
+def test_max_length_escaped_title_and_content_are_accepted():
+    title = "😀" * MAX_TITLE_LENGTH
+    content = "😀" * MAX_CONTENT_LENGTH
+    response = _post_note(content, title=title)
+    assert response.status_code == 201
+    assert response.json()["title"] == title
+    assert response.json()["content"] == content
+
+
+def test_title_over_max_length_is_rejected():
+    response = _post_note("x", title="x" * (MAX_TITLE_LENGTH + 1))
+    assert response.status_code == 422
+
+
+def test_content_over_max_length_is_rejected():
+    response = _post_note("x" * (MAX_CONTENT_LENGTH + 1))
+    assert response.status_code == 422
+
+
+def test_body_over_limit_is_rejected_before_parsing():
+    response = _post_note("x" * (MAX_BODY_BYTES + 1))
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body too large"}
@@ -0,0 +1,85 @@
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.api.main import MAX_BODY_BYTES
+from src.api.main import app as notes_app
+from src.api.middleware import FastCORSMiddleware
+
+ORIGIN = "http://frontend.example"
+
+
+async def _endpoint(request: Request) -> PlainTextResponse:
+    headers = {"vary": "Accept-Encoding"} if "vary" in request.query_params else None
+    return PlainTextResponse(f"app saw {request.method}", headers=headers)
+
+
+client = TestClient(
+    Starlette(
+        routes=[Route("/", _endpoint, methods=["GET", "OPTIONS"])],
+        middleware=[Middleware(FastCORSMiddleware)],
+    )
+)
+
+
+def _cors_headers(response) -> dict:
+    return {k: v for k, v in response.headers.items() if k.startswith("access-control-") or k == "vary"}
+
+
+def test_request_without_origin_gets_no_cors_headers():
+    response = client.get("/")
+    assert response.status_code == 200
+    assert _cors_headers(response) == {}
+
+
+def test_simple_request_echoes_origin_with_credentials():
+    response = client.get("/", headers={"Origin": ORIGIN})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers.get_list("vary") == ["Origin"]
+
+
+def test_existing_vary_header_gets_origin_appended():
+    response = client.get("/?vary=1", headers={"Origin": ORIGIN})
+    assert response.headers.get_list("vary") == ["Accept-Encoding, Origin"]
+
+
+def test_preflight_is_answered_directly():
+    response = client.options(
+        "/",
+        headers={
+            "Origin": ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type, x-custom",
+        },
+    )
+    assert response.status_code == 204
+    assert response.content == b""
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-headers"] == "content-type, x-custom"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers.get_list("vary") == ["Origin"]
+
+
+def test_plain_options_without_request_method_reaches_the_app():
+    response = client.options("/", headers={"Origin": ORIGIN})
+    assert response.status_code == 200
+    assert response.text == "app saw OPTIONS"
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+
+
+def test_body_size_rejection_carries_cors_headers():
+    response = TestClient(notes_app).post(
+        "/notes",
+        content=b"x" * (MAX_BODY_BYTES + 1),
+        headers={"Origin": ORIGIN, "content-type": "application/json"},
+    )
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers.get_list("vary") == ["Origin"]
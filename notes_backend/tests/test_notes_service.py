@@ -0,0 +1,104 @@
+import random
+
+import orjson
+import pytest
+
+from src.api.main import NoteCreate, NotesService, NoteUpdate
+
+
+def _create(service: NotesService, title: str) -> str:
+    return service.create(NoteCreate(title=title)).id
+
+
+def _listed_titles(service: NotesService) -> list:
+    return [note["title"] for note in orjson.loads(service.list_bytes())]
+
+
+def test_delete_middle_moves_last_note_into_hole():
+    service = NotesService()
+    a, b, c = (_create(service, title) for title in ("a", "b", "c"))
+    assert _listed_titles(service) == ["a", "b", "c"]
+
+    service.delete(b)
+    assert _listed_titles(service) == ["a", "c"]
+    with pytest.raises(KeyError):
+        service.get(b)
+
+    # The moved note is still reachable by get, update and delete through its patched slot
+    assert service.get(c).title == "c"
+    assert service.update(c, NoteUpdate(title="c2")).title == "c2"
+    assert service.get(c).title == "c2"
+    assert _listed_titles(service) == ["a", "c2"]
+
+    service.delete(c)
+    assert _listed_titles(service) == ["a"]
+    assert service.get(a).title == "a"
+    with pytest.raises(KeyError):
+        service.get(c)
+
+
+def test_delete_last_note():
+    service = NotesService()
+    a, b = _create(service, "a"), _create(service, "b")
+
+    service.delete(b)
+    assert _listed_titles(service) == ["a"]
+    assert service.get(a).title == "a"
+    with pytest.raises(KeyError):
+        service.delete(b)
+
+
+def test_delete_only_note():
+    service = NotesService()
+    a = _create(service, "a")
+
+    service.delete(a)
+    assert _listed_titles(service) == []
+    with pytest.raises(KeyError):
+        service.get(a)
+
+    b = _create(service, "b")
+    assert service.get(b).title == "b"
+    assert _listed_titles(service) == ["b"]
+
+
+def test_lookup_accepts_hex_and_uppercase_ids():
+    service = NotesService()
+    a = _create(service, "a")
+
+    assert service.get(a.replace("-", "")).id == a
+    assert service.get(a.upper()).id == a
+
+
+def test_list_bytes_reflects_each_mutation():
+    service = NotesService()
+    assert service.list_bytes() == b"[]"
+
+    a = _create(service, "a")
+    assert _listed_titles(service) == ["a"]
+    service.update(a, NoteUpdate(content="body"))
+    assert orjson.loads(service.list_bytes())[0]["content"] == "body"
+    service.delete(a)
+    assert service.list_bytes() == b"[]"
+
+
+def test_matches_dict_model_under_random_operations():
+    rng = random.Random(0)
+    service = NotesService()
+    expected = {}
+    for i in range(2000):
+        if not expected or rng.random() < 0.5:
+            note_id = _create(service, f"t{i}")
+            expected[note_id] = f"t{i}"
+        elif rng.random() < 0.5:
+            note_id = rng.choice(list(expected))
+            service.delete(note_id)
+            del expected[note_id]
+        else:
+            note_id = rng.choice(list(expected))
+            service.update(note_id, NoteUpdate(title=f"u{i}"))
+            expected[note_id] = f"u{i}"
+
+    assert {note["id"]: note["title"] for note in orjson.loads(service.list_bytes())} == expected
+    for note_id, title in expected.items():
+        assert service.get(note_id).title == title